@@ -14,13 +14,11 @@ from .enums import *
 from .errors import *
 from .file import *
 from .flag import *
-from .flag import *
 from .guild import *
 from .http import *
 from .invite import *
 from .member import *
 from .mentions import *
-from .mentions import *
 from .message import *
 from .multipart import *
 from .object import *
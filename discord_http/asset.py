@@ -1,4 +1,7 @@
-from typing import Self
+import asyncio
+
+from functools import lru_cache
+from typing import Self, Optional, Union
 
 from . import http
 from .errors import HTTPException
@@ -8,25 +11,34 @@ __all__ = (
 )
 
 
+def _is_animated(key: str) -> bool:
+    """ `bool`: Whether the asset hash belongs to an animated asset """
+    return key[:2] == "a_"
+
+
 class Asset:
+    __slots__ = ("_url", "_route", "_animated", "_key")
+
     BASE = "https://cdn.discordapp.com"
 
     def __init__(
         self,
         *,
-        url: str,
         key: str,
-        animated: bool = False
+        animated: bool = False,
+        url: Optional[str] = None,
+        route: tuple[Union[str, int], ...] = ()
     ):
-        self._url: str = url
+        self._url: Optional[str] = url
+        self._route: tuple[Union[str, int], ...] = route
         self._animated: bool = animated
         self._key: str = key
 
     def __str__(self) -> str:
-        return self._url
+        return self.url
 
     def __repr__(self) -> str:
-        shorten = self._url.replace(self.BASE, "")
+        shorten = self.url.replace(self.BASE, "")
         return f"<Asset url={shorten}>"
 
     async def fetch(self) -> bytes:
@@ -62,9 +74,39 @@ class Asset:
         `int`
             The amount of bytes written to the file
         """
-        data = await self.fetch()
-        with open(path, "wb") as f:
-            return f.write(data)
+        return await http.download(self.url, path)
+
+    @classmethod
+    async def fetch_many(
+        cls,
+        assets: list["Asset"],
+        *,
+        limit: int = 16
+    ) -> list[bytes]:
+        """
+        Fetches multiple assets at the same time
+
+        Parameters
+        ----------
+        assets: `list[Asset]`
+            The assets to fetch
+        limit: `int`
+            How many assets can be downloaded at the same time
+
+        Returns
+        -------
+        `list[bytes]`
+            The asset data, in the same order as the assets provided
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def _fetch(asset: "Asset") -> bytes:
+            async with semaphore:
+                return await asset.fetch()
+
+        return await asyncio.gather(*[
+            _fetch(g) for g in assets
+        ])
 
     @property
     def url(self) -> str:
@@ -76,6 +118,12 @@ class Asset:
         `str`
             The URL of the asset
         """
+        if self._url is None:
+            # Most assets are never fetched, so only build the URL when asked
+            route = "/".join(str(g) for g in self._route)
+            format = "gif" if self._animated else "png"
+            self._url = f"{self.BASE}/{route}/{self._key}.{format}?size=1024"
+
         return self._url
 
     @property
@@ -102,88 +150,79 @@ class Asset:
         return self._animated
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_avatar(
         cls,
         user_id: int,
         avatar: str
     ) -> Self:
-        animated = avatar.startswith("a_")
-        format = "gif" if animated else "png"
         return cls(
-            url=f"{cls.BASE}/avatars/{user_id}/{avatar}.{format}?size=1024",
             key=avatar,
-            animated=animated
+            animated=_is_animated(avatar),
+            route=("avatars", user_id)
         )
 
     @classmethod
+    @lru_cache(maxsize=8192)
     def _from_guild_avatar(
         cls,
         guild_id: int,
         member_id: int,
         avatar: str
     ) -> Self:
-        animated = avatar.startswith("a_")
-        format = "gif" if animated else "png"
         return cls(
-            url=f"{cls.BASE}/guilds/{guild_id}/users/{member_id}/avatars/{avatar}.{format}?size=1024",
             key=avatar,
-            animated=animated
+            animated=_is_animated(avatar),
+            route=("guilds", guild_id, "users", member_id, "avatars")
         )
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_guild_icon(
         cls,
         guild_id: int,
         icon_hash: str
     ) -> Self:
-        animated = icon_hash.startswith('a_')
-        format = 'gif' if animated else 'png'
         return cls(
-            url=f'{cls.BASE}/icons/{guild_id}/{icon_hash}.{format}?size=1024',
             key=icon_hash,
-            animated=animated,
+            animated=_is_animated(icon_hash),
+            route=("icons", guild_id)
         )
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_guild_banner(
         cls,
         guild_id: int,
         banner_hash: str
     ) -> Self:
-        animated = banner_hash.startswith('a_')
-        format = 'gif' if animated else 'png'
         return cls(
-            url=f'{cls.BASE}/banners/{guild_id}/{banner_hash}.{format}?size=1024',
             key=banner_hash,
-            animated=animated,
+            animated=_is_animated(banner_hash),
+            route=("banners", guild_id)
         )
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_avatar_decoration(
         cls,
         decoration: str
     ) -> Self:
-        animated = (
-            decoration.startswith("v2_a_") or
-            decoration.startswith("a_")
-        )
-
         return cls(
             url=f"{cls.BASE}/avatar-decoration-presets/{decoration}.png?size=96&passthrough=true",
             key=decoration,
-            animated=animated
+            animated=decoration.startswith(("v2_a_", "a_"))
         )
 
     @classmethod
+    @lru_cache(maxsize=4096)
     def _from_banner(
         cls,
         user_id: int,
         banner: str
     ) -> Self:
-        animated = banner.startswith("a_")
-        format = "gif" if animated else "png"
         return cls(
-            url=f"{cls.BASE}/banners/{user_id}/{banner}.{format}?size=1024",
             key=banner,
-            animated=animated
+            animated=_is_animated(banner),
+            route=("banners", user_id)
         )
@@ -1,22 +1,25 @@
 import asyncio
-import copy
+import json
 import logging
 import signal
+import time
 
-from datetime import datetime
+from binascii import a2b_hex, Error as BinasciiError
+from datetime import datetime, timedelta
 from hypercorn.asyncio import serve
 from hypercorn.config import Config as HyperConfig
+from nacl.bindings import crypto_sign_open
 from nacl.exceptions import BadSignatureError
 from nacl.signing import VerifyKey
 from quart import Quart, request, abort
 from quart import Response as QuartResponse
 from quart.logging import default_handler
 from quart.utils import MustReloadError, restart
-from typing import Optional, Any, Union, TYPE_CHECKING
+from typing import Optional, Any, Union, Callable, Awaitable, TYPE_CHECKING
 
 from . import utils
 from .commands import Command, SubGroup
-from .enums import InteractionType
+from .enums import InteractionType, ResponseType
 from .errors import CheckFailed
 from .response import BaseResponse, Ping, MessageResponse
 
@@ -30,36 +33,95 @@ __all__ = (
     "DiscordHTTP",
 )
 
+# Shared defaults for dict.get() lookups on interaction data,
+# these are only ever read from and must never be mutated
+_EMPTY_DICT: dict = {}
+_EMPTY_LIST: list = []
+
+# Plain ints of the interaction types, to skip IntEnum lookups per request
+_IT_PING = int(InteractionType.ping)
+_IT_CMD = int(InteractionType.application_command)
+_IT_COMP = int(InteractionType.message_component)
+_IT_AUTO = int(InteractionType.application_command_autocomplete)
+_IT_MODAL = int(InteractionType.modal_submit)
+
+_RT_PONG = int(ResponseType.pong.value)
+
+_ACCESS_LOG_FORMAT = "%(h)s %(r)s %(s)s %(b)s %(D)s"
+
+# Bodies above this size are verified in a worker thread, below it the
+# thread hand-off costs more than the time the event loop is blocked
+_VERIFY_IN_THREAD_SIZE = 64 * 1024
+
 
 def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
     """ Used by Quart to cancel all tasks on shutdown. """
-    tasks = [
-        task for task in asyncio.all_tasks(loop)
-        if not task.done()
-    ]
+    tasks: list[asyncio.Task] = []
+    for task in asyncio.all_tasks(loop):
+        if not task.done():
+            task.cancel()
+            tasks.append(task)
 
     if not tasks:
         return
 
-    for task in list(tasks):
-        task.cancel()
-
-        if task.get_coro().__name__ == "_windows_signal_support":  # type: ignore
-            tasks.remove(task)
-
     loop.run_until_complete(
         asyncio.gather(*tasks, return_exceptions=True)
     )
 
     for task in tasks:
-        if not task.cancelled() and task.exception() is not None:
+        if task.cancelled():
+            continue
+
+        exception = task.exception()
+        if exception is not None:
             loop.call_exception_handler({
                 "message": "unhandled exception during shutdown",
-                "exception": task.exception(),
+                "exception": exception,
                 "task": task
             })
 
 
+class _PingShortcut:
+    """
+    ASGI wrapper that answers `GET /` with `DiscordHTTP.index_ping`
+    directly, skipping Quart's request context and routing for health checks
+    """
+    def __init__(self, backend: "DiscordHTTP", asgi_app: Callable):
+        self.backend = backend
+        self.asgi_app = asgi_app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if (
+            scope["type"] != "http" or
+            scope["method"] != "GET" or
+            scope["path"] != "/"
+        ):
+            return await self.asgi_app(scope, receive, send)
+
+        payload = await self.backend.index_ping()
+
+        status = 200
+        if isinstance(payload, tuple):
+            payload, status = payload
+
+        # Same bytes as the Quart JSON response this replaces,
+        # compact separators and a trailing newline
+        body = (
+            self.backend.json.dumps(payload, separators=(",", ":")) + "\n"
+        ).encode("utf-8")
+
+        await send({
+            "type": "http.response.start",
+            "status": status,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("ascii")),
+            ]
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
 class DiscordHTTP(Quart):
     def __init__(self, *, client: "Client"):
         """
@@ -67,11 +129,36 @@ class DiscordHTTP(Quart):
         We recommend to not touch this class, unless you know what you're doing
         """
         self.uptime: datetime = utils.utcnow()
+        self._uptime_iso: str = str(self.uptime.astimezone().isoformat())
+        self._uptime_unix: int = int(self.uptime.timestamp())
+        self._uptime_mono: float = time.monotonic()
+        self._ping_me: Optional[dict] = None
 
         self.bot: "Client" = client
         self.loop = self.bot.loop
         self.debug_events = self.bot.debug_events
 
+        # Raw key bytes handed straight to libsodium on every request,
+        # VerifyKey is only used once here to validate the public key
+        self._public_key: Optional[bytes] = None
+        if self.bot.public_key:
+            self._public_key = VerifyKey(
+                bytes.fromhex(self.bot.public_key)
+            ).encode()
+
+        self._hyper_configs: dict[str, HyperConfig] = {}
+
+        # raw_interaction payloads are parsed and dispatched off the request path
+        self._debug_queue: Optional[asyncio.Queue[bytes]] = None
+        self._debug_worker: Optional[asyncio.Task] = None
+
+        self._interaction_handlers: dict[int, Callable[..., Awaitable[Union[QuartResponse, dict]]]] = {
+            _IT_CMD: self._handle_application_command,
+            _IT_COMP: self._handle_interaction,
+            _IT_MODAL: self._handle_interaction,
+            _IT_AUTO: self._handle_autocomplete,
+        }
+
         super().__init__(__name__)
 
         # Remove Quart's default logging handler
@@ -79,76 +166,119 @@ class DiscordHTTP(Quart):
         _quart_log.removeHandler(default_handler)
         _quart_log.setLevel(logging.CRITICAL)
 
-    async def _validate_request(self) -> None:
+    async def _validate_request(self) -> bytes:
         """
         Used to validate requests sent by Discord Webhooks
         This should NOT be modified, unless you know what you're doing
+
+        Returns
+        -------
+        `bytes`
+            The raw request body that was verified
         """
-        if not self.bot.public_key:
+        if not self._public_key:
             return abort(401, "invalid public key")
 
-        verify_key = VerifyKey(bytes.fromhex(self.bot.public_key))
         signature: str = request.headers.get("X-Signature-Ed25519", "")
         timestamp: str = request.headers.get("X-Signature-Timestamp", "")
 
+        # Ed25519 signatures are always 64 bytes (128 hex characters),
+        # so reject garbage before it ever reaches libsodium
+        if len(signature) != 128 or not timestamp:
+            return abort(401, "invalid request signature")
+
         try:
-            data = await request.data
-            body = data.decode("utf-8")
-            verify_key.verify(
-                f"{timestamp}{body}".encode(),
-                bytes.fromhex(signature)
-            )
+            signature_bytes = a2b_hex(signature)
+        except BinasciiError:
+            return abort(401, "invalid request signature")
+
+        try:
+            # Verify against the raw bytes, which are then parsed directly
+            body = await request.get_data(cache=True)
+            # One join instead of chained + to avoid intermediate copies
+            signed = b"".join((signature_bytes, timestamp.encode("ascii"), body))
+
+            if len(body) > _VERIFY_IN_THREAD_SIZE:
+                # libsodium releases the GIL, keep the event loop free
+                await asyncio.to_thread(
+                    crypto_sign_open, signed, self._public_key
+                )
+            else:
+                crypto_sign_open(signed, self._public_key)
         except BadSignatureError:
             abort(401, "invalid request signature")
         except Exception:
             abort(400, "invalid request body")
 
+        return body
+
     def _dig_subcommand(
         self,
         cmd: Union[Command, SubGroup],
-        data: dict
-    ) -> tuple[Optional[Command], list[dict]]:
+        data_options: list[dict]
+    ) -> tuple[Optional[Command], list[dict], Optional[QuartResponse]]:
         """
         Used to dig through subcommands to execute correct command/autocomplete
         """
-        data_options: list[dict] = data["data"].get("options", [])
-
         while isinstance(cmd, SubGroup):
-            find_next_step = next((
-                g for g in data_options
-                if g.get("name", None) and not g.get("value", None)
-            ), None)
-
-            if not find_next_step:
-                return abort(400, "invalid command")
+            # Subcommands and groups are the options without a value
+            find_next_step = None
+            for g in data_options:
+                if "value" not in g and "name" in g:
+                    find_next_step = g
+                    break
+
+            if find_next_step is None:
+                return None, data_options, QuartResponse(
+                    "invalid command",
+                    status=400
+                )
 
-            cmd = cmd.subcommands.get(find_next_step["name"], None)  # type: ignore
+            next_cmd = cmd.subcommands.get(find_next_step["name"], None)
 
-            if not cmd:
-                _log.warn(
-                    f"Unhandled subcommand: {find_next_step['name']} "
-                    "(not found in local command list)"
+            if next_cmd is None:
+                _log.warning(
+                    "Unhandled subcommand: %s (not found in local command list)",
+                    find_next_step["name"]
+                )
+                return None, data_options, QuartResponse(
+                    "command not found",
+                    status=404
                 )
-                return abort(404, "command not found")
 
-            data_options = find_next_step.get("options", [])
+            cmd = next_cmd
+            data_options = find_next_step.get("options", _EMPTY_LIST)
 
-        return cmd, data_options
+        return cmd, data_options, None
 
-    def _handle_ack_ping(
+    async def _handle_unknown(
+        self,
+        data: dict
+    ) -> Union[QuartResponse, dict]:
+        """ Used to handle interaction types that are not supported """
+        _log.debug("Unhandled interaction recieved (type: %s)", data.get("type", -1))
+        return QuartResponse(
+            "invalid request body",
+            status=400
+        )
+
+    async def _handle_ack_ping(
         self,
-        ctx: "Context",
         data: dict
     ) -> dict:
-        """ Used to handle ACK ping """
-        _ping = Ping(state=self.bot.state, data=data)
+        """
+        Used to handle ACK ping
+        Called before a `Context` is made, as the pong does not need one
+        """
+        bot = self.bot
+        _ping = Ping(state=bot.state, data=data)
 
-        if self.bot.has_any_dispatch("ping"):
-            self.bot.dispatch("ping", _ping)
+        if bot.has_any_dispatch("ping"):
+            bot.dispatch("ping", _ping)
         else:
-            _log.info(f"Discord Interactions ACK recieved ({_ping.id})")
+            _log.info("Discord Interactions ACK recieved (%s)", _ping.id)
 
-        return ctx.response.pong()
+        return {"type": _RT_PONG}
 
     async def _handle_application_command(
         self,
@@ -158,20 +288,27 @@ class DiscordHTTP(Quart):
         """ Used to handle application commands """
         _log.debug("Received slash command, processing...")
 
-        command_name = data["data"]["name"]
-        cmd = self.bot.commands.get(command_name, None)
+        interaction_data: dict = data["data"]
+        command_name = interaction_data["name"]
+
+        bot = self.bot
+        cmd = bot.commands.get(command_name, None)
 
         if not cmd:
-            _log.warn(
-                f"Unhandeled command: {command_name} "
-                "(not found in local command list)"
+            _log.warning(
+                "Unhandeled command: %s (not found in local command list)",
+                command_name
             )
             return QuartResponse(
                 "command not found",
                 status=404
             )
 
-        cmd, _ = self._dig_subcommand(cmd, data)
+        cmd, _, error = self._dig_subcommand(
+            cmd, interaction_data.get("options", _EMPTY_LIST)
+        )
+        if error is not None:
+            return error
 
         # Now that the command is found, let context know about it
         ctx.command = cmd
@@ -186,11 +323,11 @@ class DiscordHTTP(Quart):
                 content_type=payload.content_type
             )
         except Exception as e:
-            if self.bot.has_any_dispatch("interaction_error"):
-                self.bot.dispatch("interaction_error", ctx, e)
+            if bot.has_any_dispatch("interaction_error"):
+                bot.dispatch("interaction_error", ctx, e)
             else:
                 _log.error(
-                    f"Error while running command {cmd.name}",
+                    "Error while running command %s", cmd.name,
                     exc_info=e
                 )
 
@@ -207,13 +344,19 @@ class DiscordHTTP(Quart):
     ) -> Union[QuartResponse, dict]:
         """ Used to handle interactions """
         _log.debug("Received interaction, processing...")
-        _custom_id = data["data"]["custom_id"]
+        _custom_id = data.get("data", _EMPTY_DICT).get("custom_id", None)
+        if _custom_id is None:
+            return QuartResponse(
+                "missing custom_id",
+                status=400
+            )
+
+        bot = self.bot
 
         try:
-            if ctx.message:
-                local_view = self.bot._view_storage.get(
-                    ctx.message.id, None
-                )
+            message = ctx.message
+            if message:
+                local_view = bot._view_storage.get(message.id, None)
                 if local_view:
                     payload = await local_view.callback(ctx)
                     return QuartResponse(
@@ -221,11 +364,11 @@ class DiscordHTTP(Quart):
                         content_type=payload.content_type
                     )
 
-            intreact = self.bot.find_interaction(_custom_id)
+            intreact = bot.find_interaction(_custom_id)
             if not intreact:
                 _log.debug(
-                    "Unhandled interaction recieved "
-                    f"(custom_id: {_custom_id})"
+                    "Unhandled interaction recieved (custom_id: %s)",
+                    _custom_id
                 )
                 return QuartResponse(
                     "interaction not found",
@@ -239,11 +382,11 @@ class DiscordHTTP(Quart):
             )
 
         except Exception as e:
-            if self.bot.has_any_dispatch("interaction_error"):
-                self.bot.dispatch("interaction_error", ctx, e)
+            if bot.has_any_dispatch("interaction_error"):
+                bot.dispatch("interaction_error", ctx, e)
             else:
                 _log.error(
-                    f"Error while running interaction {_custom_id}",
+                    "Error while running interaction %s", _custom_id,
                     exc_info=e
                 )
 
@@ -257,28 +400,39 @@ class DiscordHTTP(Quart):
         """ Used to handle autocomplete interactions """
         _log.debug("Received autocomplete interaction, processing...")
 
-        command_name = data.get("data", {}).get("name", None)
-        cmd = self.bot.commands.get(command_name)
+        try:
+            interaction_data: dict = data["data"]
+            command_name: Optional[str] = interaction_data["name"]
+        except KeyError:
+            interaction_data, command_name = _EMPTY_DICT, None
+
+        bot = self.bot
+        cmd = bot.commands.get(command_name, None)
 
         try:
             if not cmd:
-                _log.warn(f"Unhandled autocomplete recieved (name: {command_name})")
+                _log.warning("Unhandled autocomplete recieved (name: %s)", command_name)
                 return QuartResponse(
                     "command not found",
                     status=404
                 )
 
-            cmd, data_options = self._dig_subcommand(cmd, data)
-
-            find_focused = next((
-                x for x in data_options
-                if x.get("focused", False)
-            ), None)
-
-            if not find_focused:
-                _log.warn(
-                    "Failed to find focused option in autocomplete "
-                    f"(cmd name: {command_name})"
+            cmd, data_options, error = self._dig_subcommand(
+                cmd, interaction_data.get("options", _EMPTY_LIST)
+            )
+            if error is not None:
+                return error
+
+            find_focused = None
+            for x in data_options:
+                if x.get("focused", False):
+                    find_focused = x
+                    break
+
+            if find_focused is None:
+                _log.warning(
+                    "Failed to find focused option in autocomplete (cmd name: %s)",
+                    command_name
                 )
                 return QuartResponse(
                     "focused option not found",
@@ -289,15 +443,61 @@ class DiscordHTTP(Quart):
                 ctx, find_focused["name"], find_focused["value"]
             )
         except Exception as e:
-            if self.bot.has_any_dispatch("interaction_error"):
-                self.bot.dispatch("interaction_error", ctx, e)
+            if bot.has_any_dispatch("interaction_error"):
+                bot.dispatch("interaction_error", ctx, e)
             else:
                 _log.error(
-                    f"Error while running autocomplete {cmd.name}",
+                    "Error while running autocomplete %s", cmd.name,
                     exc_info=e
                 )
             return abort(500)
 
+    def _queue_raw_interaction(self, body: bytes) -> None:
+        """
+        Queue the raw request body to be dispatched as `raw_interaction`.
+        If the queue is full, the payload is dropped instead of
+        slowing down the response to Discord.
+        """
+        if (
+            self._debug_queue is None or
+            self._debug_worker is None or
+            self._debug_worker.done() or
+            self._debug_worker.get_loop() is not asyncio.get_running_loop()
+        ):
+            # Made together, so both belong to the loop that runs the worker
+            self._debug_queue = asyncio.Queue(maxsize=1024)
+            self._debug_worker = asyncio.create_task(
+                self._drain_debug_queue()
+            )
+
+        try:
+            self._debug_queue.put_nowait(body)
+        except asyncio.QueueFull:
+            _log.warning("raw_interaction queue is full, dropping payload")
+
+    async def _drain_debug_queue(self) -> None:
+        """ Background worker that dispatches queued `raw_interaction` events """
+        queue = self._debug_queue
+        if queue is None:
+            return
+
+        dispatch = self.bot.dispatch
+
+        while True:
+            batch = [await queue.get()]
+
+            # Grab whatever else piled up while waiting, up to a limit
+            while len(batch) < 64:
+                try:
+                    batch.append(queue.get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+
+            for body in batch:
+                # Parsing the raw body gives every listener an
+                # independent copy, without copy.deepcopy()
+                dispatch("raw_interaction", json.loads(body))
+
     async def _index_interactions_endpoint(
         self
     ) -> Union[QuartResponse, dict]:
@@ -305,43 +505,32 @@ class DiscordHTTP(Quart):
         The main function to handle all HTTP requests sent by Discord
         Please do not touch this function, unless you know what you're doing
         """
-        await self._validate_request()
-        data = await request.json
+        body = await self._validate_request()
 
-        if self.debug_events:
-            self.bot.dispatch(
-                "raw_interaction",
-                copy.deepcopy(data)
-            )
+        try:
+            # Parse the verified bytes once, skipping request.json's
+            # mimetype check and extra round through Quart's JSON provider
+            data = json.loads(body)
+        except ValueError:
+            return abort(400, "invalid request body")
 
-        context = self.bot._context(self.bot, data)
-        data_type = data.get("type", -1)
+        bot = self.bot
 
-        match data_type:
-            case InteractionType.ping:
-                return self._handle_ack_ping(context, data)
+        if self.debug_events and bot.has_any_dispatch("raw_interaction"):
+            self._queue_raw_interaction(body)
 
-            case InteractionType.application_command:
-                return await self._handle_application_command(
-                    context, data
-                )
+        data_type = data.get("type", -1)
+        if data_type == _IT_PING:
+            return await self._handle_ack_ping(data)
 
-            case x if x in (
-                InteractionType.message_component,
-                InteractionType.modal_submit
-            ):
-                return await self._handle_interaction(
-                    context, data
-                )
+        # Checked before making the Context, which does not accept unknown types
+        handler = self._interaction_handlers.get(data_type, None)
+        if handler is None:
+            return await self._handle_unknown(data)
 
-            case InteractionType.application_command_autocomplete:
-                return await self._handle_autocomplete(
-                    context, data
-                )
+        context = bot._context(bot, data)
 
-            case _:  # Unknown
-                _log.debug(f"Unhandled interaction recieved (type: {data_type})")
-                return abort(400, "invalid request body")
+        return await handler(context, data)
 
     def error_messages(
         self,
@@ -380,17 +569,23 @@ class DiscordHTTP(Quart):
         if not self.bot.is_ready():
             return {"error": "bot is not ready yet"}, 503
 
-        return {
-            "@me": {
+        if self._ping_me is None:
+            # The bot user does not change while running, only build this once
+            self._ping_me = {
                 "id": self.bot.user.id,
                 "username": self.bot.user.name,
                 "discriminator": self.bot.user.discriminator,
                 "created_at": str(self.bot.user.created_at.isoformat()),
-            },
+            }
+
+        return {
+            "@me": self._ping_me,
             "last_reboot": {
-                "datetime": str(self.uptime.astimezone().isoformat()),
-                "timedelta": str(utils.utcnow() - self.uptime),
-                "unix": int(self.uptime.timestamp()),
+                "datetime": self._uptime_iso,
+                "timedelta": str(timedelta(
+                    seconds=time.monotonic() - self._uptime_mono
+                )),
+                "unix": self._uptime_unix,
             }
         }
 
@@ -408,6 +603,9 @@ class DiscordHTTP(Quart):
                 methods=["GET"]
             )
 
+            # The route above stays for HEAD and anything else using Quart's routing
+            self.asgi_app = _PingShortcut(self, self.asgi_app)  # type: ignore
+
         self.add_url_rule(
             "/",
             "index",
@@ -433,6 +631,12 @@ class DiscordHTTP(Quart):
     ) -> None:
         """ ## Do NOT use this function, use `start` instead """
         loop.set_debug(False)
+
+        if hasattr(asyncio, "eager_task_factory"):
+            # Python 3.12+, lets tasks that finish without awaiting
+            # skip the event loop scheduling entirely
+            loop.set_task_factory(asyncio.eager_task_factory)
+
         shutdown_event = asyncio.Event()
 
         def _signal_handler(*_: Any) -> None:
@@ -482,6 +686,7 @@ class DiscordHTTP(Quart):
         finally:
             try:
                 _cancel_all_tasks(loop)
+                loop.run_until_complete(self.bot.state.close())
                 loop.run_until_complete(loop.shutdown_asyncgens())
             finally:
                 asyncio.set_event_loop(None)
@@ -497,18 +702,26 @@ class DiscordHTTP(Quart):
         shutdown_trigger=None
     ):
         """ ## Do NOT use this function, use `start` instead """
-        config = HyperConfig()
-        config.access_log_format = "%(h)s %(r)s %(s)s %(b)s %(D)s"
-        config.accesslog = None
-        config.bind = [f"{host}:{port}"]
-        config.ca_certs = None
-        config.certfile = None
-        config.debug = False
-        config.errorlog = None
-        config.keyfile = None
-
         return serve(
             self,
-            config,
+            self._make_hyper_config(host, port),
             shutdown_trigger=shutdown_trigger
         )
+
+    def _make_hyper_config(self, host: str, port: int) -> HyperConfig:
+        """
+        Used to make the Hypercorn config for `run_task`
+        Only the settings that differ from Hypercorn's defaults are set,
+        and the config is reused for every serve on the same bind
+        """
+        bind = f"{host}:{port}"
+
+        config = self._hyper_configs.get(bind, None)
+        if config is None:
+            config = HyperConfig()
+            config.access_log_format = _ACCESS_LOG_FORMAT
+            config.errorlog = None
+            config.bind = [bind]
+            self._hyper_configs[bind] = config
+
+        return config
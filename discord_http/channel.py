@@ -1,5 +1,13 @@
+import asyncio
+import contextlib
+import sys
+
 from datetime import datetime, timedelta
-from typing import Union, TYPE_CHECKING, Optional, AsyncIterator, Callable, Self
+from functools import cached_property
+from typing import (
+    Union, TYPE_CHECKING, Optional, AsyncIterator,
+    Callable, Coroutine, Self
+)
 
 from . import utils
 from .embeds import Embed
@@ -10,20 +18,21 @@ from .enums import (
 )
 from .file import File
 from .flag import PermissionOverwrite, ChannelFlags
+from .guild import PartialGuild
 from .member import ThreadMember
 from .mentions import AllowedMentions
+from .message import PartialMessage, Message
 from .multipart import MultipartData
 from .object import PartialBase, Snowflake
 from .response import MessageResponse
+from .user import PartialUser, User
 from .view import View
 from .webhook import Webhook
 
 if TYPE_CHECKING:
-    from .guild import PartialGuild
     from .http import DiscordAPI
     from .invite import Invite
-    from .message import PartialMessage, Message, Poll
-    from .user import PartialUser, User
+    from .message import Poll
 
 MISSING = utils.MISSING
 
@@ -50,6 +59,25 @@ __all__ = (
 )
 
 
+async def _bounded_gather(coros: list[Coroutine], concurrency: int) -> None:
+    """
+    Await all coroutines concurrently, but at most `concurrency` at a time.
+    Keeps bulk helpers from flooding a single rate limit bucket at once.
+    """
+    if concurrency < 1:
+        for g in coros:
+            g.close()
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(coro: Coroutine) -> None:
+        async with semaphore:
+            await coro
+
+    await asyncio.gather(*[_run(g) for g in coros])
+
+
 class PartialChannel(PartialBase):
     def __init__(
         self,
@@ -63,6 +91,7 @@ class PartialChannel(PartialBase):
         self.guild_id: Optional[int] = guild_id
 
         self._raw_type: ChannelType = ChannelType.unknown
+        self._guild_cache: Optional["PartialGuild"] = None
 
     def __repr__(self) -> str:
         return f"<PartialChannel id={self.id}>"
@@ -70,11 +99,14 @@ class PartialChannel(PartialBase):
     @property
     def guild(self) -> Optional["PartialGuild"]:
         """ `Optional[PartialGuild]`: The guild the channel belongs to (if available) """
-        from .guild import PartialGuild
-
         if not self.guild_id:
             return None
-        return PartialGuild(state=self._state, id=self.guild_id)
+
+        # Reuse the same partial guild as long as the guild ID stays the same
+        if self._guild_cache is None or self._guild_cache.id != self.guild_id:
+            self._guild_cache = PartialGuild(state=self._state, id=self.guild_id)
+
+        return self._guild_cache
 
     @property
     def type(self) -> ChannelType:
@@ -95,7 +127,6 @@ class PartialChannel(PartialBase):
         `PartialMessage`
             The partial message object
         """
-        from .message import PartialMessage
         return PartialMessage(
             state=self._state,
             channel_id=self.id,
@@ -121,7 +152,6 @@ class PartialChannel(PartialBase):
             f"/channels/{self.id}/messages/{message_id}"
         )
 
-        from .message import Message
         return Message(
             state=self._state,
             data=r.response,
@@ -137,20 +167,32 @@ class PartialChannel(PartialBase):
         `list[Message]`
             The list of pinned messages
         """
+        return [g async for g in self.iter_pins()]
+
+    async def iter_pins(self) -> AsyncIterator["Message"]:
+        """
+        Iterate over the pinned messages for the channel in question.
+        Messages are only built as they are consumed,
+        so breaking out early skips the rest.
+
+        Yields
+        ------
+        `Message`
+            The pinned message object
+        """
         r = await self._state.query(
             "GET",
             f"/channels/{self.id}/pins"
         )
 
-        from .message import Message
-        return [
-            Message(
+        guild = self.guild
+
+        for data in r.response:
+            yield Message(
                 state=self._state,
                 data=data,
-                guild=self.guild
+                guild=guild
             )
-            for data in r.response
-        ]
 
     async def follow_announcement_channel(
         self,
@@ -185,7 +227,6 @@ class PartialChannel(PartialBase):
             f"/channels/{self.id}/threads/archived/public"
         )
 
-        from .channel import PublicThread
         return [
             PublicThread(
                 state=self._state,
@@ -218,7 +259,6 @@ class PartialChannel(PartialBase):
 
         r = await self._state.query("GET", path)
 
-        from .channel import PrivateThread
         return [
             PrivateThread(
                 state=self._state,
@@ -333,11 +373,9 @@ class PartialChannel(PartialBase):
         r = await self._state.query(
             "POST",
             f"/channels/{self.id}/messages",
-            data=payload.to_multipart(is_request=True),
-            headers={"Content-Type": payload.content_type}
+            **payload.to_request_kwargs()
         )
 
-        from .message import Message
         return Message(
             state=self._state,
             data=r.response
@@ -349,40 +387,7 @@ class PartialChannel(PartialBase):
         *,
         state: Optional["DiscordAPI"] = None
     ) -> "BaseChannel":
-        match data["type"]:
-            case x if x in (ChannelType.guild_text, ChannelType.guild_news):
-                _class = TextChannel
-
-            case ChannelType.guild_voice:
-                _class = VoiceChannel
-
-            case ChannelType.guild_category:
-                _class = CategoryChannel
-
-            case ChannelType.guild_news_thread:
-                _class = NewsThread
-
-            case ChannelType.guild_public_thread:
-                _class = PublicThread
-
-            case ChannelType.guild_private_thread:
-                _class = PrivateThread
-
-            case ChannelType.guild_stage_voice:
-                _class = StageChannel
-
-            case ChannelType.guild_forum:
-                _class = ForumChannel
-
-            case _:
-                _class = BaseChannel
-
-        _class: type["BaseChannel"]
-
-        return _class(
-            state=state or self._state,
-            data=data
-        )
+        return self.from_dict(state=state or self._state, data=data)  # type: ignore
 
     @classmethod
     def from_dict(cls, *, state: "DiscordAPI", data: dict) -> Self:
@@ -402,25 +407,41 @@ class PartialChannel(PartialBase):
         `BaseChannel`
             The channel object
         """
-        temp_class = cls(
-            state=state,
-            id=int(data["id"]),
-            guild_id=utils.get_int(data, "guild_id")
-        )
+        _class = _CHANNEL_TYPES.get(data["type"], BaseChannel)
 
-        return temp_class._class_to_return(data=data, state=state)  # type: ignore
+        return _class(state=state, data=data)  # type: ignore
+
+    async def fetch(self, *, force: bool = False) -> "BaseChannel":
+        """
+        Fetches the channel and returns the channel object
+
+        Parameters
+        ----------
+        force: `bool`
+            Skip the channel cache (if enabled) and always ask Discord API
+
+        Returns
+        -------
+        `BaseChannel`
+            The channel object
+        """
+        if not force:
+            cached = self._state.get_channel_cache(self.id)
+            if cached is not None:
+                return cached
 
-    async def fetch(self) -> "BaseChannel":
-        """ `BaseChannel`: Fetches the channel and returns the channel object """
         r = await self._state.query(
             "GET",
             f"/channels/{self.id}"
         )
 
-        return self._class_to_return(
+        channel = self._class_to_return(
             data=r.response
         )
 
+        self._state.set_channel_cache(channel)
+        return channel
+
     async def edit(
         self,
         *,
@@ -634,7 +655,9 @@ class PartialChannel(PartialBase):
             reason=reason
         )
 
-        return self._class_to_return(data=r.response)  # type: ignore
+        channel = self._class_to_return(data=r.response)
+        self._state.set_channel_cache(channel)
+        return channel  # type: ignore
 
     async def typing(self) -> None:
         """
@@ -674,6 +697,35 @@ class PartialChannel(PartialBase):
             reason=reason
         )
 
+        self._state.clear_channel_cache(self.id)
+
+    async def bulk_set_permissions(
+        self,
+        overwrites: list[tuple[Union[Snowflake, int], PermissionOverwrite]],
+        *,
+        reason: Optional[str] = None,
+        concurrency: int = 10
+    ) -> None:
+        """
+        Set several permission overwrites for the channel at once
+
+        Parameters
+        ----------
+        overwrites: `list[tuple[Union[Snowflake, int], PermissionOverwrite]]`
+            Pairs of overwrite ID and the new overwrite permissions
+        reason: `Optional[str]`
+            The reason for editing the overwrites
+        concurrency: `int`
+            How many requests can be in flight at the same time
+        """
+        await _bounded_gather([
+            self.set_permission(id, overwrite=overwrite, reason=reason)
+            for id, overwrite in overwrites
+        ], concurrency)
+
+        # A fetch() between the writes could have cached a half updated channel
+        self._state.clear_channel_cache(self.id)
+
     async def delete_permission(
         self,
         id: Union[Snowflake, int],
@@ -697,6 +749,8 @@ class PartialChannel(PartialBase):
             reason=reason
         )
 
+        self._state.clear_channel_cache(self.id)
+
     async def delete(
         self,
         *,
@@ -717,6 +771,8 @@ class PartialChannel(PartialBase):
             res_method="text"
         )
 
+        self._state.clear_channel_cache(self.id)
+
     async def delete_messages(
         self,
         message_ids: list[int],
@@ -738,13 +794,18 @@ class PartialChannel(PartialBase):
         `ValueError`
             If you provide >100 IDs to delete
         """
-        if len(message_ids) <= 0:
+        # Discord rejects bulk deletes with duplicate IDs,
+        # dedupe them while keeping the order they were given in
+        message_ids = list(dict.fromkeys(int(m) for m in message_ids))
+        total = len(message_ids)
+
+        if total <= 0:
             return None
 
-        if len(message_ids) == 1:
+        if total == 1:
             msg = self.get_partial_message(message_ids[0])
             return await msg.delete(reason=reason)
-        if len(message_ids) > 100:
+        if total > 100:
             raise ValueError("message_ids must be less than or equal to 100")
 
         await self._state.query(
@@ -846,7 +907,7 @@ class PartialChannel(PartialBase):
             "message": {}
         }
 
-        if auto_archive_duration in (60, 1440, 4320, 10080):
+        if auto_archive_duration in utils.VALID_ARCHIVE_DURATIONS:
             payload["auto_archive_duration"] = auto_archive_duration
 
         if rate_limit_per_user is not None:
@@ -951,14 +1012,14 @@ class PartialChannel(PartialBase):
             "invitable": invitable,
         }
 
-        if auto_archive_duration not in (60, 1440, 4320, 10080):
+        if auto_archive_duration not in utils.VALID_ARCHIVE_DURATIONS:
             raise ValueError("auto_archive_duration must be 60, 1440, 4320 or 10080")
 
         if rate_limit_per_user is not None:
             if isinstance(rate_limit_per_user, timedelta):
                 rate_limit_per_user = int(rate_limit_per_user.total_seconds())
 
-            if rate_limit_per_user not in range(0, 21601):
+            if rate_limit_per_user not in utils.VALID_RATE_LIMIT_PER_USER:
                 raise ValueError("rate_limit_per_user must be between 0 and 21600 seconds")
 
             payload["rate_limit_per_user"] = rate_limit_per_user
@@ -970,18 +1031,9 @@ class PartialChannel(PartialBase):
             reason=reason
         )
 
-        match r.response["type"]:
-            case ChannelType.guild_public_thread:
-                _class = PublicThread
-
-            case ChannelType.guild_private_thread:
-                _class = PrivateThread
-
-            case ChannelType.guild_news_thread:
-                _class = NewsThread
-
-            case _:
-                raise ValueError("Invalid thread type")
+        _class = _THREAD_TYPES.get(r.response["type"], None)
+        if _class is None:
+            raise ValueError("Invalid thread type")
 
         return _class(
             state=self._state,
@@ -1016,6 +1068,101 @@ class PartialChannel(PartialBase):
         `Message`
             The message object
         """
+        guild = self.guild
+
+        pages = self._history_pages(
+            before=before,
+            after=after,
+            around=around,
+            limit=limit
+        )
+
+        try:
+            async for page in pages:
+                for msg in page:
+                    yield Message(
+                        state=self._state,
+                        data=msg,
+                        guild=guild
+                    )
+
+        finally:
+            await pages.aclose()
+
+    async def fetch_history_pages(
+        self,
+        *,
+        before: Optional[Union[datetime, "Message", Snowflake, int]] = None,
+        after: Optional[Union[datetime, "Message", Snowflake, int]] = None,
+        around: Optional[Union[datetime, "Message", Snowflake, int]] = None,
+        limit: Optional[int] = 100,
+        page_size: int = 100
+    ) -> AsyncIterator[list["Message"]]:
+        """
+        Fetch the channel's message history, one API page at a time.
+        Same as `fetch_history`, but useful when processing messages in batches.
+
+        Parameters
+        ----------
+        before: `Optional[Union[datetime, Message, Snowflake, int]]`
+            Get messages before this message
+        after: `Optional[Union[datetime, Message, Snowflake, int]]`
+            Get messages after this message
+        around: `Optional[Union[datetime, Message, Snowflake, int]]`
+            Get messages around this message
+        limit: `Optional[int]`
+            The maximum amount of messages to fetch.
+            `None` will fetch all messages.
+        page_size: `int`
+            How many messages to request per page, between 1 and 100
+
+        Yields
+        ------
+        `list[Message]`
+            The messages of one page
+
+        Raises
+        ------
+        `ValueError`
+            - If `page_size` is not between 1 and 100
+        """
+        guild = self.guild
+
+        pages = self._history_pages(
+            before=before,
+            after=after,
+            around=around,
+            limit=limit,
+            page_size=page_size
+        )
+
+        try:
+            async for page in pages:
+                yield [
+                    Message(
+                        state=self._state,
+                        data=msg,
+                        guild=guild
+                    )
+                    for msg in page
+                ]
+
+        finally:
+            await pages.aclose()
+
+    async def _history_pages(
+        self,
+        *,
+        before: Optional[Union[datetime, "Message", Snowflake, int]] = None,
+        after: Optional[Union[datetime, "Message", Snowflake, int]] = None,
+        around: Optional[Union[datetime, "Message", Snowflake, int]] = None,
+        limit: Optional[int] = 100,
+        page_size: int = 100
+    ) -> AsyncIterator[list[dict]]:
+        """ Yields the raw message payloads of each history page """
+        if page_size not in range(1, 101):
+            raise ValueError("page_size must be between 1 and 100")
+
         def _resolve_id(entry) -> int:
             match entry:
                 case x if isinstance(x, Snowflake):
@@ -1036,11 +1183,12 @@ class PartialChannel(PartialBase):
                     raise TypeError("Got an unknown type for before/after/around")
 
         async def _get_history(limit: int, **kwargs):
+            # IDs are resolved once below, the cursors passed here are already ints
             params = {"limit": limit}
             for key, value in kwargs.items():
                 if value is None:
                     continue
-                params[key] = _resolve_id(value)
+                params[key] = value
 
             return await self._state.query(
                 "GET",
@@ -1098,28 +1246,40 @@ class PartialChannel(PartialBase):
         else:
             strategy, state = _before_http, None
 
-        # Must be imported here to avoid circular import
-        # From the top of the file
-        from .message import Message
-
-        while True:
-            http_limit: int = 100 if limit is None else min(limit, 100)
-            if http_limit <= 0:
-                break
-
-            strategy: Callable
-            messages, state, limit = await strategy(http_limit, state, limit)
+        strategy: Callable
+        http_limit: int = page_size if limit is None else min(limit, page_size)
+        if http_limit <= 0:
+            return
 
-            i = 0
-            for i, msg in enumerate(messages, start=1):
-                yield Message(
-                    state=self._state,
-                    data=msg,
-                    guild=self.guild
-                )
+        next_page: Optional[asyncio.Task] = asyncio.create_task(
+            strategy(http_limit, state, limit)
+        )
 
-            if i < 100:
-                break
+        try:
+            while next_page is not None:
+                messages, state, limit = await next_page
+                next_page = None
+
+                # A short page means there is nothing left to fetch,
+                # and around only ever needs the one request.
+                # Otherwise, request the next page while this one is consumed
+                if len(messages) >= http_limit and strategy is not _around_http:
+                    http_limit = page_size if limit is None else min(limit, page_size)
+                    if http_limit > 0:
+                        next_page = asyncio.create_task(
+                            strategy(http_limit, state, limit)
+                        )
+
+                if messages:
+                    yield messages
+
+        finally:
+            # Wait for the cancelled prefetch so it is not left pending
+            # and its result or error is not reported as never retrieved
+            if next_page is not None:
+                next_page.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await next_page
 
     async def join_thread(self) -> None:
         """ Make the bot join a thread """
@@ -1129,6 +1289,9 @@ class PartialChannel(PartialBase):
             res_method="text"
         )
 
+        # The bot's own user ID is not known here, so forget the whole thread
+        self._state.clear_thread_member_cache(self.id)
+
     async def leave_thread(self) -> None:
         """ Make the bot leave a thread """
         await self._state.query(
@@ -1137,6 +1300,9 @@ class PartialChannel(PartialBase):
             res_method="text"
         )
 
+        # The bot's own user ID is not known here, so forget the whole thread
+        self._state.clear_thread_member_cache(self.id)
+
     async def add_thread_member(
         self,
         user_id: int
@@ -1155,6 +1321,8 @@ class PartialChannel(PartialBase):
             res_method="text"
         )
 
+        self._state.clear_thread_member_cache(self.id, int(user_id))
+
     async def remove_thread_member(
         self,
         user_id: int
@@ -1173,9 +1341,55 @@ class PartialChannel(PartialBase):
             res_method="text"
         )
 
+        self._state.clear_thread_member_cache(self.id, int(user_id))
+
+    async def bulk_add_thread_members(
+        self,
+        user_ids: list[Union[Snowflake, int]],
+        *,
+        concurrency: int = 10
+    ) -> None:
+        """
+        Add several thread members at once
+
+        Parameters
+        ----------
+        user_ids: `list[Union[Snowflake, int]]`
+            The user IDs to add
+        concurrency: `int`
+            How many requests can be in flight at the same time
+        """
+        await _bounded_gather([
+            self.add_thread_member(int(g))
+            for g in user_ids
+        ], concurrency)
+
+    async def bulk_remove_thread_members(
+        self,
+        user_ids: list[Union[Snowflake, int]],
+        *,
+        concurrency: int = 10
+    ) -> None:
+        """
+        Remove several thread members at once
+
+        Parameters
+        ----------
+        user_ids: `list[Union[Snowflake, int]]`
+            The user IDs to remove
+        concurrency: `int`
+            How many requests can be in flight at the same time
+        """
+        await _bounded_gather([
+            self.remove_thread_member(int(g))
+            for g in user_ids
+        ], concurrency)
+
     async def fetch_thread_member(
         self,
-        user_id: int
+        user_id: int,
+        *,
+        force: bool = False
     ) -> ThreadMember:
         """
         Fetch a thread member
@@ -1184,46 +1398,77 @@ class PartialChannel(PartialBase):
         ----------
         user_id: `int`
             The user ID to fetch
+        force: `bool`
+            Skip the thread member cache (if enabled) and always ask Discord API
 
         Returns
         -------
         `ThreadMember`
             The thread member object
         """
+        if not force:
+            cached = self._state.get_thread_member_cache(self.id, int(user_id))
+            if cached is not None:
+                return cached
+
         r = await self._state.query(
             "GET",
             f"/channels/{self.id}/thread-members/{user_id}",
             params={"with_member": "true"}
         )
 
-        return ThreadMember(
+        member = ThreadMember(
             state=self._state,
             data=r.response,
         )
 
-    async def fetch_thread_members(self) -> list[ThreadMember]:
+        self._state.set_thread_member_cache(self.id, int(user_id), member)
+        return member
+
+    async def fetch_thread_members(
+        self,
+        *,
+        force: bool = False
+    ) -> list[ThreadMember]:
         """
         Fetch all thread members
 
+        Parameters
+        ----------
+        force: `bool`
+            Skip the thread member cache (if enabled) and always ask Discord API
+
         Returns
         -------
         `list[ThreadMember]`
             The list of thread members
         """
-        r = await self._state.query(
+        state = self._state
+
+        if not force:
+            cached = state.get_thread_member_list_cache(self.id)
+            if cached is not None:
+                return list(cached)
+
+        r = await state.query(
             "GET",
             f"/channels/{self.id}/thread-members",
             params={"with_member": "true"},
         )
 
-        return [
+        members = [
             ThreadMember(
-                state=self._state,
+                state=state,
                 data=data
             )
             for data in r.response
         ]
 
+        # Stored as a copy, callers are free to change the returned list
+        state.set_thread_member_list_cache(self.id, list(members))
+
+        return members
+
 
 class BaseChannel(PartialChannel):
     def __init__(self, *, state: "DiscordAPI", data: dict):
@@ -1233,8 +1478,11 @@ class BaseChannel(PartialChannel):
             guild_id=utils.get_int(data, "guild_id")
         )
 
-        self.id: int = int(data["id"])
+        # Names repeat across every fetch of the same channel,
+        # interning lets those copies share one string
         self.name: Optional[str] = data.get("name", None)
+        if self.name is not None:
+            self.name = sys.intern(self.name)
         self.nsfw: bool = data.get("nsfw", False)
         self.topic: Optional[str] = data.get("topic", None)
         self.position: Optional[int] = utils.get_int(data, "position")
@@ -1275,7 +1523,7 @@ class TextChannel(BaseChannel):
     @property
     def type(self) -> ChannelType:
         """ `ChannelType`: Returns the channel's type """
-        if self._raw_type == 0:
+        if self._raw_type is ChannelType.guild_text:
             return ChannelType.guild_text
         return ChannelType.guild_news
 
@@ -1295,12 +1543,10 @@ class DMChannel(BaseChannel):
 
     def _from_data(self, data: dict):
         if data.get("recipients", None):
-            from .user import User
             self.user = User(state=self._state, data=data["recipients"][0])
             self.name = self.user.name
 
         if data.get("last_message_id", None):
-            from .message import PartialMessage
             self.last_message = PartialMessage(
                 state=self._state,
                 channel_id=self.id,
@@ -1529,40 +1775,34 @@ class PublicThread(BaseChannel):
         self.archived: bool = self._metadata.get("archived", False)
         self.auto_archive_duration: int = self._metadata.get("auto_archive_duration", 60)
 
-        self.channel_id: int = int(data["id"])
+        self.channel_id: int = self.id
         self.guild_id: int = int(data["guild_id"])
         self.owner_id: int = int(data["owner_id"])
-        self.last_message_id: Optional[int] = utils.get_int(data, "last_message_id")
-        self.parent_id: Optional[int] = utils.get_int(data, "parent_id")
 
     def __repr__(self) -> str:
         return f"<PublicThread id={self.id} name='{self.name}'>"
 
-    @property
+    @cached_property
     def channel(self) -> "PartialChannel":
         """ `PartialChannel`: Returns a partial channel object """
-        from .channel import PartialChannel
         return PartialChannel(state=self._state, id=self.channel_id)
 
     @property
     def guild(self) -> "PartialGuild":
         """ `PartialGuild`: Returns a partial guild object """
-        from .guild import PartialGuild
-        return PartialGuild(state=self._state, id=self.guild_id)
+        return super().guild  # type: ignore
 
-    @property
+    @cached_property
     def owner(self) -> "PartialUser":
         """ `PartialUser`: Returns a partial user object """
-        from .user import PartialUser
         return PartialUser(state=self._state, id=self.owner_id)
 
-    @property
+    @cached_property
     def last_message(self) -> Optional["PartialMessage"]:
         """ `Optional[PartialMessage]`: Returns a partial message object if the last message ID is available """
         if not self.last_message_id:
             return None
 
-        from .message import PartialMessage
         return PartialMessage(
             state=self._state,
             channel_id=self.channel_id,
@@ -1571,10 +1811,18 @@ class PublicThread(BaseChannel):
 
 
 class ForumTag:
+    __slots__ = (
+        "id",
+        "name",
+        "moderated",
+        "emoji_id",
+        "emoji_name",
+    )
+
     def __init__(self, *, data: dict):
         self.id: Optional[int] = utils.get_int(data, "id")
 
-        self.name: str = data["name"]
+        self.name: str = sys.intern(data["name"])
         self.moderated: bool = data["moderated"]
 
         self.emoji_id: Optional[int] = utils.get_int(data, "emoji_id")
@@ -1681,8 +1929,6 @@ class ForumThread(PublicThread):
         return self.name
 
     def _from_data(self, data: dict):
-        from .message import Message
-
         self.message: Message = Message(
             state=self._state,
             data=data["message"],
@@ -1715,7 +1961,7 @@ class Thread(PublicThread):
     @property
     def type(self) -> ChannelType:
         """ `ChannelType`: Returns the channel's type """
-        if self._raw_type == 11:
+        if self._raw_type is ChannelType.guild_public_thread:
             return ChannelType.guild_public_thread
         return ChannelType.guild_private_thread
 
@@ -1723,6 +1969,14 @@ class Thread(PublicThread):
 # Voice channels
 
 class VoiceRegion:
+    __slots__ = (
+        "id",
+        "name",
+        "custom",
+        "deprecated",
+        "optimal",
+    )
+
     def __init__(self, *, data: dict):
         self.id: str = data["id"]
         self.name: str = data["name"]
@@ -1764,3 +2018,24 @@ class StageChannel(VoiceChannel):
     def type(self) -> ChannelType:
         """ `ChannelType`: Returns the channel's type """
         return ChannelType.guild_stage_voice
+
+
+# Looked up by the raw "type" integer from Discord,
+# instead of comparing it against every ChannelType member
+_CHANNEL_TYPES: dict[int, type[BaseChannel]] = {
+    int(ChannelType.guild_text): TextChannel,
+    int(ChannelType.guild_news): TextChannel,
+    int(ChannelType.guild_voice): VoiceChannel,
+    int(ChannelType.guild_category): CategoryChannel,
+    int(ChannelType.guild_news_thread): NewsThread,
+    int(ChannelType.guild_public_thread): PublicThread,
+    int(ChannelType.guild_private_thread): PrivateThread,
+    int(ChannelType.guild_stage_voice): StageChannel,
+    int(ChannelType.guild_forum): ForumChannel,
+}
+
+_THREAD_TYPES: dict[int, type[PublicThread]] = {
+    int(ChannelType.guild_public_thread): PublicThread,
+    int(ChannelType.guild_private_thread): PrivateThread,
+    int(ChannelType.guild_news_thread): NewsThread,
+}
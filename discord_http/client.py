@@ -4,7 +4,7 @@ import inspect
 import logging
 
 from datetime import datetime
-from typing import Dict, Optional, Any, Callable, Union, AsyncIterator
+from typing import Dict, Optional, Any, Callable, Union, AsyncIterator, Self
 
 from . import utils
 from .backend import DiscordHTTP
@@ -28,6 +28,13 @@ from .user import User, PartialUser
 from .view import InteractionStorage
 from .webhook import PartialWebhook, Webhook
 
+try:
+    # Optional, libuv based event loop that is noticeably faster
+    # than the default asyncio loop for lots of small requests
+    import uvloop
+except ImportError:
+    uvloop = None
+
 _log = logging.getLogger(__name__)
 
 __all__ = (
@@ -50,7 +57,11 @@ class Client:
         logging_level: int = logging.INFO,
         disable_default_get_path: bool = False,
         disable_oauth_hint: bool = False,
-        debug_events: bool = False
+        debug_events: bool = False,
+        pool_size: int = 100,
+        cache_channels: bool = False,
+        channel_cache_ttl: float = 300.0,
+        thread_member_cache_ttl: Optional[float] = None
     ):
         """
         The main client class for discord.http
@@ -70,7 +81,8 @@ class Client:
         api_version: `Optional[int]`
             API version to use, if not provided, it will use the default (10)
         loop: `Optional[asyncio.AbstractEventLoop]`
-            Event loop to use, if not provided, it will use `asyncio.get_running_loop()`
+            Event loop to use, if not provided, it will use `asyncio.get_running_loop()`.
+            If there is no running loop, a new one is made, using uvloop when it is installed.
         allowed_mentions: `AllowedMentions`
             Allowed mentions to use, if not provided, it will use `AllowedMentions.all()`
         logging_level: `int`
@@ -84,6 +96,20 @@ class Client:
         disable_oauth_hint: `bool`
             Whether to disable the OAuth2 hint or not on boot.
             If not provided, it will use `False`.
+        pool_size: `int`
+            How many connections to Discord API can be open at once, 0 for no limit.
+            Raise it if you run a lot of API calls at the same time, if not provided, it will use `100`.
+        cache_channels: `bool`
+            Whether to keep channels in memory after they are fetched or edited.
+            If enabled, `PartialChannel.fetch()` returns the stored channel instead of calling the API,
+            unless `force=True` is used. If not provided, it will use `False`.
+        channel_cache_ttl: `float`
+            How many seconds a cached channel is kept, only used with `cache_channels`.
+            At most 1024 channels are kept at once. If not provided, it will use `300`.
+        thread_member_cache_ttl: `Optional[float]`
+            How many seconds fetched thread members are kept in memory.
+            While cached, `fetch_thread_member()` and `fetch_thread_members()` skip the API call,
+            unless `force=True` is used. If not provided, thread members are not cached.
         """
         self.application_id: Optional[int] = application_id
         self.public_key: Optional[str] = public_key
@@ -99,13 +125,20 @@ class Client:
         try:
             self.loop: asyncio.AbstractEventLoop = loop or asyncio.get_running_loop()
         except RuntimeError:
-            self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
+            if uvloop is not None:
+                self.loop: asyncio.AbstractEventLoop = uvloop.new_event_loop()
+            else:
+                self.loop: asyncio.AbstractEventLoop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
 
         self.state: DiscordAPI = DiscordAPI(
             application_id=application_id,
             token=token,
-            api_version=api_version
+            api_version=api_version,
+            pool_size=pool_size,
+            cache_channels=cache_channels,
+            channel_cache_ttl=channel_cache_ttl,
+            thread_member_cache_ttl=thread_member_cache_ttl
         )
 
         self.commands: Dict[str, Command] = {}
@@ -398,6 +431,27 @@ class Client:
 
         await self._ready.wait()
 
+    async def close(self) -> None:
+        """
+        Closes the connections made to Discord API.
+        `Client.start()` does this on shutdown, so this is only needed
+        when the client is used on its own, for example in a script.
+
+        Example:
+
+        .. code-block:: python
+
+            async with Client(token="...") as client:
+                user = await client.fetch_user(123)
+        """
+        await self.state.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, type, value, traceback) -> None:
+        await self.close()
+
     def dispatch(
         self,
         event_name: str,
@@ -277,6 +277,13 @@ class Permissions(BaseFlag):
 
 
 class PermissionOverwrite:
+    __slots__ = (
+        "allow",
+        "deny",
+        "target",
+        "target_type",
+    )
+
     def __init__(
         self,
         target: Union[Snowflake, int],
@@ -1,8 +1,12 @@
 import aiohttp
 import asyncio
+import contextlib
 import json
 import logging
+import os
+import secrets
 import sys
+import time
 
 from aiohttp.client_exceptions import ContentTypeError
 from collections import deque
@@ -18,7 +22,16 @@ from .errors import (
     AutomodBlock
 )
 
+try:
+    # Optional, C based JSON library that encodes request bodies and
+    # parses large API responses several times faster than the stdlib
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
+    from .channel import BaseChannel
+    from .member import ThreadMember
     from .user import User
 
 MethodTypes = Literal["GET", "POST", "DELETE", "PUT", "HEAD", "PATCH", "OPTIONS"]
@@ -27,12 +40,40 @@ ResponseT = TypeVar("ResponseT")
 
 _log = logging.getLogger(__name__)
 
+# Most entries each opt-in cache holds at once
+_CHANNEL_CACHE_MAX_SIZE = 1024
+_THREAD_MEMBER_CACHE_MAX_SIZE = 1024
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def _json_dumps(data: Any) -> Union[str, bytes]:
+    """ Compact JSON for request bodies, using orjson when it is installed """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"))
+
+
 __all__ = (
     "DiscordAPI",
     "HTTPResponse",
 )
 
 
+def _prune_cache(cache: dict[Any, tuple[float, Any]], max_size: int) -> None:
+    """ Make room in an expiring cache, dropping expired and then the oldest entries """
+    if len(cache) < max_size:
+        return
+
+    now = time.monotonic()
+    for key in [k for k, v in cache.items() if v[0] < now]:
+        cache.pop(key, None)
+
+    # Still full, drop the oldest entries first
+    while len(cache) >= max_size:
+        cache.pop(next(iter(cache)))
+
+
 class HTTPResponse(Generic[ResponseT]):
     def __init__(
         self,
@@ -94,6 +135,7 @@ async def query(
     url: str,
     *,
     res_method: ResMethodTypes = "text",
+    session: Optional[aiohttp.ClientSession] = None,
     **kwargs
 ) -> HTTPResponse:
     """
@@ -107,13 +149,23 @@ async def query(
         The URL to make the request to
     res_method: `Optional[str]`
         The method to use to get the response, defaults to text
+    session: `Optional[aiohttp.ClientSession]`
+        The session to make the request with.
+        If not provided, a new session is made and closed after the request
 
     Returns
     -------
     `HTTPResponse`
         The response from the request
     """
-    session = aiohttp.ClientSession()
+    if session is None:
+        async with aiohttp.ClientSession() as session:
+            return await query(
+                method, url,
+                res_method=res_method,
+                session=session,
+                **kwargs
+            )
 
     if not res_method:
         res_method = "text"
@@ -130,11 +182,14 @@ async def query(
 
     async with session_method(str(url), **kwargs) as res:
         try:
-            r = await getattr(res, res_method.lower())()
+            if res_method == "json":
+                r = await res.json(loads=_json_loads)
+            else:
+                r = await getattr(res, res_method.lower())()
         except ContentTypeError:
             if res_method == "json":
                 try:
-                    r = json.loads(await res.text())
+                    r = _json_loads(await res.text())
                 except json.JSONDecodeError:
                     # Give up trying, something is really wrong...
                     r = await res.text()
@@ -151,10 +206,75 @@ async def query(
             headers=res.headers
         )
 
-    await session.close()
     return output
 
 
+async def download(
+    url: str,
+    path: str,
+    *,
+    chunk_size: int = 65536,
+    **kwargs
+) -> int:
+    """
+    Download a file using the aiohttp library, writing it to disk in chunks
+    instead of holding the whole response in memory first
+
+    Parameters
+    ----------
+    url: `str`
+        The URL to download from
+    path: `str`
+        Path to save the file to, which includes the filename and extension
+    chunk_size: `int`
+        How many bytes to read and write at a time
+
+    Returns
+    -------
+    `int`
+        The amount of bytes written to the file
+
+    Raises
+    ------
+    `HTTPException`
+        If the request returned anything other than 2XX
+    """
+    async with (
+        aiohttp.ClientSession() as session,
+        session.get(str(url), **kwargs) as res
+    ):
+        if res.status not in range(200, 300):
+            raise HTTPException(HTTPResponse(
+                status=res.status,
+                response=await res.text(),
+                res_method="text",
+                reason=res.reason,
+                headers=res.headers
+            ))
+
+        # Written next to the target and moved into place once complete,
+        # with the file I/O done off the event loop
+        temp_path = f"{path}.{secrets.token_hex(4)}.part"
+        f = await asyncio.to_thread(open, temp_path, "wb")
+
+        written = 0
+        try:
+            try:
+                async for chunk in res.content.iter_chunked(chunk_size):
+                    written += await asyncio.to_thread(f.write, chunk)
+            finally:
+                await asyncio.to_thread(f.close)
+
+            await asyncio.to_thread(os.replace, temp_path, path)
+        except BaseException:
+            # Never leave a half written file behind
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+        return written
+
+
 class Ratelimit:
     def __init__(self, key: str):
         self._key: str = key
@@ -265,11 +385,21 @@ class DiscordAPI:
         *,
         token: str,
         application_id: Optional[int],
-        api_version: Optional[int] = None
+        api_version: Optional[int] = None,
+        pool_size: int = 100,
+        cache_channels: bool = False,
+        channel_cache_ttl: float = 300.0,
+        thread_member_cache_ttl: Optional[float] = None
     ):
         self.token: str = token
         self.application_id: Optional[int] = application_id
 
+        self.pool_size: int = pool_size
+        if not isinstance(self.pool_size, int):
+            raise TypeError("pool_size must be an integer")
+        if self.pool_size < 0:
+            raise ValueError("pool_size must be 0 (no limit) or higher")
+
         self.api_version: int = api_version or 10
         if not isinstance(self.api_version, int):
             raise TypeError("api_version must be an integer")
@@ -278,6 +408,60 @@ class DiscordAPI:
         self.api_url: str = f"{self.base_url}/v{self.api_version}"
 
         self._buckets: dict[str, Ratelimit] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Opt-in, channels by ID as last fetched or edited, with an expiry time
+        self.channel_cache_ttl: float = channel_cache_ttl
+        self.channel_cache: Optional[dict[int, tuple[float, "BaseChannel"]]] = (
+            {} if cache_channels and channel_cache_ttl > 0 else None
+        )
+
+        # Opt-in, thread members by (channel ID, user ID) and the full
+        # member lists by channel ID, both with an expiry time
+        self.thread_member_cache_ttl: Optional[float] = thread_member_cache_ttl
+        self.thread_member_cache: Optional[dict[tuple[int, int], tuple[float, "ThreadMember"]]] = (
+            {} if thread_member_cache_ttl and thread_member_cache_ttl > 0 else None
+        )
+        self.thread_member_list_cache: Optional[dict[int, tuple[float, list["ThreadMember"]]]] = (
+            {} if thread_member_cache_ttl and thread_member_cache_ttl > 0 else None
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the session used for Discord API requests, creating it if needed.
+        It is made lazily, as a session has to be created inside the running loop.
+        """
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._session_loop is not loop:
+            # Made in a previous loop, which can not be used anymore
+            await self._session.close()
+
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.pool_size,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75
+                )
+            )
+            self._session_loop = loop
+
+        return self._session
+
+    async def close(self) -> None:
+        """ Closes the session used for Discord API requests, if it is open """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+        self._session = None
+        self._session_loop = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, type, value, traceback) -> None:
+        await self.close()
 
     def _clear_old_ratelimits(self) -> None:
         if len(self._buckets) <= 256:
@@ -289,6 +473,132 @@ class DiscordAPI:
             except KeyError:
                 pass
 
+    def get_channel_cache(self, channel_id: int) -> Optional["BaseChannel"]:
+        """ Get a cached channel, if still fresh """
+        if self.channel_cache is None:
+            return None
+
+        entry = self.channel_cache.get(channel_id, None)
+        if entry is None:
+            return None
+
+        expires, channel = entry
+        if expires < time.monotonic():
+            self.channel_cache.pop(channel_id, None)
+            return None
+
+        return channel
+
+    def set_channel_cache(self, channel: "BaseChannel") -> None:
+        """ Store a channel, if caching is enabled """
+        if self.channel_cache is None:
+            return
+
+        _prune_cache(self.channel_cache, _CHANNEL_CACHE_MAX_SIZE)
+
+        # Re-insert so a refreshed channel counts as the newest entry
+        self.channel_cache.pop(channel.id, None)
+        self.channel_cache[channel.id] = (
+            time.monotonic() + self.channel_cache_ttl, channel
+        )
+
+    def clear_channel_cache(self, channel_id: int) -> None:
+        """ Forget a cached channel """
+        if self.channel_cache is None:
+            return
+
+        self.channel_cache.pop(channel_id, None)
+
+    def get_thread_member_cache(
+        self,
+        channel_id: int,
+        user_id: int
+    ) -> Optional["ThreadMember"]:
+        """ Get a cached thread member, if still fresh """
+        if self.thread_member_cache is None:
+            return None
+
+        key = (channel_id, user_id)
+        entry = self.thread_member_cache.get(key, None)
+        if entry is None:
+            return None
+
+        expires, member = entry
+        if expires < time.monotonic():
+            self.thread_member_cache.pop(key, None)
+            return None
+
+        return member
+
+    def set_thread_member_cache(
+        self,
+        channel_id: int,
+        user_id: int,
+        member: "ThreadMember"
+    ) -> None:
+        """ Store a thread member, if caching is enabled """
+        if self.thread_member_cache is None:
+            return
+
+        _prune_cache(self.thread_member_cache, _THREAD_MEMBER_CACHE_MAX_SIZE)
+
+        self.thread_member_cache[(channel_id, user_id)] = (
+            time.monotonic() + self.thread_member_cache_ttl, member  # type: ignore
+        )
+
+    def get_thread_member_list_cache(
+        self,
+        channel_id: int
+    ) -> Optional[list["ThreadMember"]]:
+        """ Get the cached member list of a thread, if still fresh """
+        if self.thread_member_list_cache is None:
+            return None
+
+        entry = self.thread_member_list_cache.get(channel_id, None)
+        if entry is None:
+            return None
+
+        expires, members = entry
+        if expires < time.monotonic():
+            self.thread_member_list_cache.pop(channel_id, None)
+            return None
+
+        return members
+
+    def set_thread_member_list_cache(
+        self,
+        channel_id: int,
+        members: list["ThreadMember"]
+    ) -> None:
+        """ Store the member list of a thread, if caching is enabled """
+        if self.thread_member_list_cache is None:
+            return
+
+        _prune_cache(self.thread_member_list_cache, _THREAD_MEMBER_CACHE_MAX_SIZE)
+
+        self.thread_member_list_cache[channel_id] = (
+            time.monotonic() + self.thread_member_cache_ttl, members  # type: ignore
+        )
+
+    def clear_thread_member_cache(
+        self,
+        channel_id: int,
+        user_id: Optional[int] = None
+    ) -> None:
+        """
+        Forget a thread member and the member list of its thread.
+        Without a user ID, every cached member of the thread is forgotten
+        """
+        if self.thread_member_cache is not None:
+            if user_id is None:
+                for key in [k for k in self.thread_member_cache if k[0] == channel_id]:
+                    self.thread_member_cache.pop(key, None)
+            else:
+                self.thread_member_cache.pop((channel_id, user_id), None)
+
+        if self.thread_member_list_cache is not None:
+            self.thread_member_list_cache.pop(channel_id, None)
+
     def get_ratelimit(self, key: str) -> Ratelimit:
         try:
             value = self._buckets[key]
@@ -390,6 +700,12 @@ class DiscordAPI:
         if reason:
             kwargs["headers"]["X-Audit-Log-Reason"] = reason
 
+        if kwargs.get("json", None) is not None:
+            # Serialize once up front (retries reuse it) and without
+            # the whitespace aiohttp's default json.dumps() adds
+            kwargs["data"] = _json_dumps(kwargs.pop("json"))
+            kwargs["headers"]["Content-Type"] = "application/json"
+
         _api_url = self.api_url
         if kwargs.pop("webhook", False):
             _api_url = self.base_url
@@ -408,6 +724,7 @@ class DiscordAPI:
                         method,
                         f"{_api_url}{path}",
                         res_method=res_method,
+                        session=await self._get_session(),
                         **kwargs
                     )
 
@@ -474,6 +474,12 @@ class PartialMember(PartialBase):
 
 
 class ThreadMember(PartialBase):
+    __slots__ = (
+        "_state",
+        "flags",
+        "join_timestamp",
+    )
+
     def __init__(self, *, state: "DiscordAPI", data: dict):
         super().__init__(id=int(data["user_id"]))
         self._state = state
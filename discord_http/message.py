@@ -485,9 +485,10 @@ class Attachment:
         `int`
             The amount of bytes written to the file
         """
-        data = await self.fetch(use_cached=use_cached)
-        with open(path, "wb") as f:
-            return f.write(data)
+        return await http.download(
+            self.proxy_url if use_cached else self.url,
+            path
+        )
 
     async def to_file(
         self,
@@ -840,8 +841,7 @@ class PartialMessage(PartialBase):
         r = await self._state.query(
             "POST",
             f"/channels/{self.channel_id}/messages",
-            data=payload.to_multipart(is_request=True),
-            headers={"Content-Type": payload.content_type}
+            **payload.to_request_kwargs()
         )
 
         return Message(
@@ -963,14 +963,14 @@ class PartialMessage(PartialBase):
             "auto_archive_duration": auto_archive_duration,
         }
 
-        if auto_archive_duration not in (60, 1440, 4320, 10080):
+        if auto_archive_duration not in utils.VALID_ARCHIVE_DURATIONS:
             raise ValueError("auto_archive_duration must be 60, 1440, 4320 or 10080")
 
         if rate_limit_per_user is not None:
             if isinstance(rate_limit_per_user, timedelta):
                 rate_limit_per_user = int(rate_limit_per_user.total_seconds())
 
-            if rate_limit_per_user not in range(0, 21601):
+            if rate_limit_per_user not in utils.VALID_RATE_LIMIT_PER_USER:
                 raise ValueError("rate_limit_per_user must be between 0 and 21600 seconds")
 
             payload["rate_limit_per_user"] = rate_limit_per_user
@@ -278,6 +278,25 @@ class MessageResponse(BaseResponse):
             return output
         return {"type": int(self.type), "data": output}
 
+    def to_request_kwargs(self) -> dict[str, Any]:
+        """
+        The keyword arguments to send this message to Discord with `DiscordAPI.query`.
+        Messages without files are sent as a plain JSON body,
+        multipart is only used when there is something to upload.
+
+        Returns
+        -------
+        `dict[str, Any]`
+            Either `json` or `data` with its `Content-Type` header
+        """
+        if not self.files:
+            return {"json": self.to_dict(is_request=True)}
+
+        return {
+            "data": self.to_multipart(is_request=True),
+            "headers": {"Content-Type": self.content_type}
+        }
+
     def to_multipart(self, is_request: bool = False) -> bytes:
         """
         The multipart data that is sent to Discord.
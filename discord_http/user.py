@@ -106,8 +106,7 @@ class PartialUser(PartialBase):
         r = await self._state.query(
             "POST",
             f"/channels/{channel_id}/messages",
-            data=payload.to_multipart(is_request=True),
-            headers={"Content-Type": payload.content_type}
+            **payload.to_request_kwargs()
         )
 
         from .message import Message
@@ -16,6 +16,10 @@ from .object import Snowflake
 
 DISCORD_EPOCH = 1420070400000
 
+# Values accepted by Discord for thread settings
+VALID_ARCHIVE_DURATIONS: frozenset[int] = frozenset({60, 1440, 4320, 10080})
+VALID_RATE_LIMIT_PER_USER: range = range(0, 21601)
+
 # RegEx patterns
 re_channel: re.Pattern = re.compile(r"<#([0-9]{15,20})>")
 re_role: re.Pattern = re.compile(r"<@&([0-9]{15,20})>")
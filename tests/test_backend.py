@@ -0,0 +1,74 @@
+import asyncio
+import json
+import time
+
+from nacl.signing import SigningKey
+
+from discord_http import Client
+
+
+def _make_client() -> tuple[Client, SigningKey]:
+    signing_key = SigningKey.generate()
+    client = Client(
+        token="token",
+        application_id=1,
+        public_key=signing_key.verify_key.encode().hex()
+    )
+
+    # Same route as DiscordHTTP.start(), without starting the server
+    client.backend.add_url_rule(
+        "/",
+        "index",
+        client.backend._index_interactions_endpoint,
+        methods=["POST"]
+    )
+
+    return client, signing_key
+
+
+def _signed_post(client: Client, signing_key: SigningKey, payload: dict):
+    body = json.dumps(payload).encode("utf-8")
+    timestamp = str(int(time.time()))
+    signature = signing_key.sign(timestamp.encode("ascii") + body).signature
+
+    return client.backend.test_client().post(
+        "/",
+        data=body,
+        headers={
+            "Content-Type": "application/json",
+            "X-Signature-Ed25519": signature.hex(),
+            "X-Signature-Timestamp": timestamp,
+        }
+    )
+
+
+def test_unknown_interaction_type_returns_400():
+    client, signing_key = _make_client()
+
+    async def run():
+        return await _signed_post(
+            client, signing_key,
+            {"id": "1", "application_id": "1", "type": 99, "token": "t"}
+        )
+
+    response = asyncio.run(run())
+    assert response.status_code == 400
+
+
+def test_ping_returns_pong():
+    client, signing_key = _make_client()
+
+    async def run():
+        response = await _signed_post(
+            client, signing_key,
+            {
+                "id": "1", "application_id": "1", "type": 1,
+                "token": "t", "version": 1,
+                "user": {"id": "2", "username": "test", "discriminator": "0"}
+            }
+        )
+        return response.status_code, await response.get_json()
+
+    status, data = asyncio.run(run())
+    assert status == 200
+    assert data == {"type": 1}